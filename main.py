@@ -1,37 +1,25 @@
 # Import necessary modules
-from src.lstspred import LineStringConstructor, RoutePlan, TimeStampPredictor
-import csv
+from src.lstspred import predict_trip
+from joblib import Parallel, delayed
+import pyarrow as pa
+import pyarrow.csv as pv
 
 # Function to load data from CSV
 def load_csv_data(filename):
-    with open(filename, mode='r', encoding='utf-8-sig') as myfile:
-        reader = csv.DictReader(myfile)
-        if 'timestamp' in reader.fieldnames:
-            # If the CSV contains timestamps, load longitude, latitude, and timestamp
-            return [(float(row.get('longitude')), float(row.get('latitude')), float(row.get('timestamp'))) for row in reader]
-        else:
-            # If no timestamp, load just longitude and latitude
-            return [(float(row.get('longitude')), float(row.get('latitude'))) for row in reader]
+    table = pv.read_csv(filename)
+    columns = ['longitude', 'latitude', 'timestamp'] if 'timestamp' in table.column_names else ['longitude', 'latitude']
+    return table.select(columns).to_pandas().astype(float)
 
 # Load shape, schedule, and trip data from CSV files
 shape = load_csv_data('example/data/shape.csv')
 schedule = load_csv_data('example/data/schedule.csv')
-trip = load_csv_data('example/data/trip.csv')
+trips = [load_csv_data('example/data/trip.csv')]
 
-# Create a LineStringConstructor object with the shape data
-my_line = LineStringConstructor(shape)
-
-# Create RoutePlan objects for the schedule and trip data
-my_schedule = RoutePlan(schedule, my_line)
-my_trip = RoutePlan(trip, my_line)
-
-# Initialize the TimeStampPredictor with the created RoutePlan objects
-predictor = TimeStampPredictor(my_schedule, my_trip)
-
-# Use the TimeStampPredictor to predict timestamps for the trip
-my_pred = predictor.predict_schedule_by_trip()
+# Predict timestamps for each trip; trips are independent, so they are processed in parallel across all cores
+predictions = Parallel(n_jobs=-1, prefer='processes')(delayed(predict_trip)(shape, schedule, trip) for trip in trips)
+my_pred = predictions[0]
 
 # Save the prediction results to a CSV file
-my_pred.to_csv('example/data/prediction_results.csv', index=False)
+pv.write_csv(pa.Table.from_pandas(my_pred, preserve_index=False), 'example/data/prediction_results.csv')
 
 print("Prediction results have been saved to 'examples/data/prediction_results.csv'")
@@ -1,5 +1,5 @@
 # src/__init__.py
 
-from .lstspred import LineStringConstructor, RoutePlan, TimeStampPredictor
+from .lstspred import LineStringConstructor, RoutePlan, TimeStampPredictor, predict_trip
 
-__all__ = ['LineStringConstructor', 'RoutePlan', 'TimeStampPredictor']
+__all__ = ['LineStringConstructor', 'RoutePlan', 'TimeStampPredictor', 'predict_trip']
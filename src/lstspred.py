@@ -1,7 +1,113 @@
 from shapely.geometry import LineString, Point
-from geopy.distance import geodesic
+import shapely
+from pyproj import Geod
 import pandas as pd
 import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _fill_weighted_duration(inv_spd, dist):
+    """
+    Forward fills the inverse speeds and calculates the weighted duration of each segment in a single pass.
+
+    Parameters:
+        inv_spd (ndarray): The inverse speeds, NaN where unknown.
+        dist (ndarray): The distances traveled along the line string.
+
+    Returns:
+        tuple of ndarray: The forward filled inverse speeds and the weighted durations, the inverse speed multiplied 
+        by the distance to the next point, NaN for the last point.
+    """
+    filled_inv_spd = np.empty_like(inv_spd)
+    weighted_duration = np.empty_like(inv_spd)
+    last_inv_spd = np.nan
+    for i in range(len(inv_spd)):
+        if not np.isnan(inv_spd[i]):
+            last_inv_spd = inv_spd[i]
+        filled_inv_spd[i] = last_inv_spd
+        if i + 1 < len(dist):
+            weighted_duration[i] = (dist[i + 1] - dist[i]) * last_inv_spd
+        else:
+            weighted_duration[i] = np.nan
+
+    return filled_inv_spd, weighted_duration
+
+
+@njit(cache=True)
+def _backfill_tail(pred, dist, inv_spd, start_idx):
+    """
+    Propagates timestamps backward from the first trip timestamp to the beginning of the merged schedule and trip.
+
+    Parameters:
+        pred (ndarray): The predicted timestamps, updated in place for indexes before start_idx.
+        dist (ndarray): The distances traveled along the line string.
+        inv_spd (ndarray): The forward filled inverse speeds.
+        start_idx (int): The index of the first trip timestamp.
+
+    Returns:
+        tuple of ndarray: The cumulative distance and time to the first trip timestamp for indexes before start_idx.
+    """
+    dist_to_closest_ts = np.empty(start_idx)
+    time_to_closest_ts = np.empty(start_idx)
+    backward_dist_to_closest_ts = 0.0
+    backward_time_to_closest_ts = 0.0
+    for unknown_timestamp in range(start_idx - 1, -1, -1):
+        next_ts = unknown_timestamp + 1
+        pred[unknown_timestamp] = pred[next_ts] - inv_spd[unknown_timestamp] * (dist[next_ts] - dist[unknown_timestamp])
+
+        backward_dist_to_closest_ts += np.abs(dist[next_ts] - dist[unknown_timestamp])
+        backward_time_to_closest_ts += np.abs(pred[next_ts] - pred[unknown_timestamp])
+
+        dist_to_closest_ts[unknown_timestamp] = backward_dist_to_closest_ts
+        time_to_closest_ts[unknown_timestamp] = backward_time_to_closest_ts
+
+    return dist_to_closest_ts, time_to_closest_ts
+
+
+@njit(cache=True)
+def _forward_tail(pred, dist, inv_spd, start_idx):
+    """
+    Propagates timestamps forward from the last trip timestamp to the end of the merged schedule and trip.
+
+    Parameters:
+        pred (ndarray): The predicted timestamps, updated in place for indexes after start_idx.
+        dist (ndarray): The distances traveled along the line string.
+        inv_spd (ndarray): The forward filled inverse speeds.
+        start_idx (int): The index of the last trip timestamp.
+
+    Returns:
+        tuple of ndarray: The cumulative distance and time to the last trip timestamp for indexes after start_idx.
+    """
+    dist_to_closest_ts = np.empty(len(pred) - start_idx - 1)
+    time_to_closest_ts = np.empty(len(pred) - start_idx - 1)
+    forward_dist_to_closest_ts = 0.0
+    forward_time_to_closest_ts = 0.0
+    for unknown_timestamp in range(start_idx + 1, len(pred)):
+        prev_ts = unknown_timestamp - 1
+        pred[unknown_timestamp] = pred[prev_ts] + inv_spd[prev_ts] * (dist[unknown_timestamp] - dist[prev_ts])
+
+        forward_dist_to_closest_ts += np.abs(dist[unknown_timestamp] - dist[prev_ts])
+        forward_time_to_closest_ts += np.abs(pred[unknown_timestamp] - pred[prev_ts])
+
+        dist_to_closest_ts[prev_ts - start_idx] = forward_dist_to_closest_ts
+        time_to_closest_ts[prev_ts - start_idx] = forward_time_to_closest_ts
+
+    return dist_to_closest_ts, time_to_closest_ts
+
+
+def _validate_float_arrays(*arrays):
+    """
+    Validates that coordinate or timestamp arrays are one dimensional float arrays of the same shape.
+
+    Parameters:
+        *arrays (ndarray): The arrays to validate.
+
+    Returns:
+        bool: True if the arrays are valid, False otherwise.
+    """
+    return all(array.ndim == 1 and array.dtype.kind == 'f' and array.shape == arrays[0].shape for array in arrays)
+
 
 class LineStringConstructor:
     """
@@ -9,113 +115,335 @@ class LineStringConstructor:
     functionality to project points onto the line string and calculate distances along it.
 
     Attributes:
-        points (list of tuples): The list of (longitude, latitude) tuples defining the line string.
+        points (ndarray): The (longitude, latitude) points defining the line string, one row per point.
         line_string (LineString): The LineString object created from the points.
+        distance_method (str): The method used to measure distances along the line string, 'geodesic' or 'haversine'.
     """
     
-    def __init__(self, points=None):
+    def __init__(self, points=None, distance_method='geodesic'):
         """
         Initializes the LineStringConstructor with a list of points.
 
         Parameters:
-            points (list of tuples): A list of (longitude, latitude) tuples. Defaults to an empty list.
+            points (list of tuples or array-like): A list of (longitude, latitude) tuples. Defaults to an empty list.
+            distance_method (str, optional): 'geodesic' for WGS84 ellipsoidal distances or 'haversine' for faster 
+            spherical distances, which are accurate enough for short segments. Defaults to 'geodesic'.
 
         Raises:
-            ValueError: If the points do not meet the requirements (at least two points, must be tuples of floats).
+            ValueError: If the points do not meet the requirements (at least two points, must be pairs of floats)
+            or the distance_method is not supported.
         """
         if points is None:
-            points = []
+            points = np.empty((0, 2))
+
+        try:
+            points = np.asarray(points)
+        except (TypeError, ValueError):
+            raise ValueError('Points must be a list of tuples (longitude, latitude) with floats.') from None
+
+        if points.size == 0:
+            points = points.reshape(0, 2)
             
         if not self._validate_points(points):
             raise ValueError('Points must be a list of tuples (longitude, latitude) with floats.')
 
+        points = points.astype(np.float64, copy=False)
+
         if len(points) < 2:
             raise ValueError('Minimum of two points are required to construct a line string')
         
-        self.points = points
-        self.line_string = self._create_line_string()
+        self._initialize(points, distance_method)
+
+    @classmethod
+    def from_arrays(cls, longitudes, latitudes, distance_method='geodesic'):
+        """
+        Creates a LineStringConstructor directly from coordinate arrays, without building a list of tuples. 
+        The coordinates are converted to float64, as in __init__.
+
+        Parameters:
+            longitudes (array-like): The longitudes of the points as floats.
+            latitudes (array-like): The latitudes of the points as floats, of the same length as longitudes.
+            distance_method (str, optional): 'geodesic' or 'haversine'. Defaults to 'geodesic'.
+
+        Returns:
+            LineStringConstructor: The LineStringConstructor created from the coordinates.
+
+        Raises:
+            ValueError: If the coordinates do not meet the requirements (at least two points, must be float arrays of the same length)
+            or the distance_method is not supported.
+        """
+        longitudes = np.asarray(longitudes)
+        latitudes = np.asarray(latitudes)
+
+        if not _validate_float_arrays(longitudes, latitudes):
+            raise ValueError('Longitudes and latitudes must be one dimensional float arrays of the same length.')
+
+        longitudes = longitudes.astype(np.float64, copy=False)
+        latitudes = latitudes.astype(np.float64, copy=False)
+
+        if len(longitudes) < 2:
+            raise ValueError('Minimum of two points are required to construct a line string')
+
+        line_string_constructor = cls.__new__(cls)
+        line_string_constructor._initialize(np.column_stack([longitudes, latitudes]), distance_method)
+
+        return line_string_constructor
         
     def project_and_calculate_distance(self, df):
         """
-        Calculate distances along a line string for points in a grouped DataFrame.
-        This function iterates over each segment of the line string. For each segment, it checks if the projected point 
-        lies on that segment or is very close to it (within a threshold of 0.0001 units). If the projected point is on 
-        the segment or close enough, the function calculates the geodesic distance from the start of the line string to 
-        the projected point and breaks the loop. If the projected point is not on the segment, the function adds the 
-        geodesic distance of the segment to the total distance. The process continues until the segment containing the 
-        projected point is found or all segments are traversed.
+        Calculate distances along a line string for points in a DataFrame.
+        Each point is projected onto the line string to find the planar arclength from the start of the line string to 
+        the projected point. Short line strings project all points in a single vectorized call, while long line strings 
+        first look up the nearest segment of each point in an STRtree, see _project_via_cumsum and _project_via_tree. 
+        As the points are sorted by occurrence, a point whose arclength falls behind the previous point is projected 
+        again onto the rest of the line string only, so routes that double back over themselves keep increasing 
+        distances. The distance is the precomputed cumulative distance to the start of the segment holding the projected 
+        point plus the distance from the segment start to the projected point, measured with the configured distance_method.
+
+        :param df: DataFrame with 'longitude' and 'latitude' columns for a single trip, sorted by occurrence.
+
+        :return: Series of float32 distances in kilometers, aligned with the index of df.
+        """
+        
+        longitudes = df['longitude'].to_numpy(dtype=np.float64)
+        latitudes = df['latitude'].to_numpy(dtype=np.float64)
+        if self._use_tree:
+            arclengths = self._project_via_tree(longitudes, latitudes)
+        else:
+            arclengths = self._project_via_cumsum(longitudes, latitudes)
+        arclengths = self._enforce_forward_progress(longitudes, latitudes, arclengths)
+
+        segment_indexes = np.clip(np.searchsorted(self._planar_cum_len, arclengths, side='right') - 1, 0, len(self._planar_segment_len) - 1)
+        segment_lengths = self._planar_segment_len[segment_indexes]
+        fractions = np.divide(arclengths - self._planar_cum_len[segment_indexes], segment_lengths, 
+                              out=np.zeros_like(arclengths), where=segment_lengths > 0)
+
+        segment_starts = self.points[segment_indexes]
+        projected_coords = segment_starts + fractions[:, np.newaxis] * (self.points[segment_indexes + 1] - segment_starts)
+        segment_start_to_point_km = self._distance_km(segment_starts[:, 0], segment_starts[:, 1], 
+                                                      projected_coords[:, 0], projected_coords[:, 1])
+
+        return pd.Series((self._cum_km[segment_indexes] + segment_start_to_point_km).astype(np.float32), index=df.index)
+
+    def _project_via_cumsum(self, longitudes, latitudes):
+        """
+        Projects points onto the whole line string in a single vectorized call, which returns the planar arclength from 
+        the start of the line string to each projected point. The projection scans every segment, which is the cheapest 
+        option for short line strings. Where several segments are equally near, the first one along the line string is used.
 
-        :param group: DataFrame group for a single trip, sorted by occurrence.
-        :param line_string: LineString object for the trip.
+        Parameters:
+            longitudes (ndarray): The longitudes of the points to project.
+            latitudes (ndarray): The latitudes of the points to project.
 
-        :return: List of distances or None for each point in the group.
+        Returns:
+            ndarray: The planar arclength of each projected point, NaN for points with a missing coordinate.
         """
-        
-        last_segment_index = -1
-        cumulative_distance = 0.0 
-        distances = []
-
-        for _, row in df.iterrows():
-            point = Point(row['longitude'], row['latitude'])
-            projected_point = self.line_string.interpolate(self.line_string.project(point))
-            point_found = False
-
-
-            for i in range(last_segment_index + 1, len(self.line_string.coords) - 1):
-                segment = LineString([self.line_string.coords[i], self.line_string.coords[i + 1]])
-                
-                # Check if point is on the segment, if yes calculate distance to the point
-                if segment.contains(projected_point) or segment.distance(projected_point) < 0.0001:  
-                    if i > 0 and last_segment_index < i:
-                        #calculate distance to the segment
-                        for j in range(last_segment_index + 1, i):
-                            cumulative_distance += geodesic(self.line_string.coords[j][::-1], self.line_string.coords[j + 1][::-1]).kilometers
-
-                    last_segment_index = i
-                    #calculate distance in the segment to the point
-                    segment_start_to_point_distance = geodesic(self.line_string.coords[i][::-1], (projected_point.y, projected_point.x)).kilometers
-                    total_distance = cumulative_distance + segment_start_to_point_distance
-                    #record the distance and skip the previous segments for the next point - this is to improve seatch efficiency
-                    distances.append(total_distance)
-                    point_found = True
-                    #calculate total distance to the point
-                    cumulative_distance += geodesic(self.line_string.coords[i][::-1], self.line_string.coords[i + 1][::-1]).kilometers
-                    break
-                
-            # Point did not project onto the line string correctly mainly because the point is near where the line string intersects iteself or there are overlaping parts
-            if not point_found:
-                distances.append(None)  
-
-        return pd.Series(distances)
+        known = ~(np.isnan(longitudes) | np.isnan(latitudes))
+        arclengths = np.full(len(longitudes), np.nan)
+        arclengths[known] = shapely.line_locate_point(self.line_string, shapely.points(longitudes[known], latitudes[known]))
+
+        return arclengths
+
+    def _project_via_tree(self, longitudes, latitudes):
+        """
+        Finds the nearest segment of each point with a single STRtree query and projects the point onto that segment 
+        only, which avoids scanning every segment of long line strings. Where several segments are equally near, such as 
+        where the line string crosses or overlaps itself, the first one along the line string is used, as in _project_via_cumsum.
+
+        Parameters:
+            longitudes (ndarray): The longitudes of the points to project.
+            latitudes (ndarray): The latitudes of the points to project.
+
+        Returns:
+            ndarray: The planar arclength of each projected point, NaN for points with a missing coordinate.
+        """
+        known = ~(np.isnan(longitudes) | np.isnan(latitudes))
+        known_coords = np.column_stack([longitudes[known], latitudes[known]])
+        point_indexes, tree_indexes = self._tree.query_nearest(shapely.points(known_coords), all_matches=True)
+        segment_indexes = np.full(len(known_coords), len(self._planar_segment_len))
+        np.minimum.at(segment_indexes, point_indexes, tree_indexes)
+
+        segment_starts = self.points[segment_indexes]
+        segment_vectors = self.points[segment_indexes + 1] - segment_starts
+        squared_lengths = np.einsum('ij,ij->i', segment_vectors, segment_vectors)
+        start_to_point = known_coords - segment_starts
+        fractions = np.divide(np.einsum('ij,ij->i', start_to_point, segment_vectors), squared_lengths, 
+                              out=np.zeros_like(squared_lengths), where=squared_lengths > 0)
+
+        arclengths = np.full(len(longitudes), np.nan)
+        arclengths[known] = self._planar_cum_len[segment_indexes] + np.clip(fractions, 0.0, 1.0) * self._planar_segment_len[segment_indexes]
+
+        return arclengths
+
+    def _enforce_forward_progress(self, longitudes, latitudes, arclengths):
+        """
+        Keeps the arclengths of points sorted by occurrence non-decreasing. Each point projected behind the farthest point 
+        before it, either by GPS noise or because the route doubles back over itself, is projected again onto the rest of 
+        the line string from that farthest arclength on, see _project_ahead. All such points are projected in one batch; 
+        as projecting a point further ahead can leave later points behind it, batches repeat until no point is behind. 
+        Points without an arclength are skipped.
+
+        Parameters:
+            longitudes (ndarray): The longitudes of the projected points, sorted by occurrence.
+            latitudes (ndarray): The latitudes of the projected points, sorted by occurrence.
+            arclengths (ndarray): The planar arclength of each projected point on the whole line string.
+
+        Returns:
+            ndarray: The non-decreasing planar arclength of each projected point.
+        """
+        while True:
+            farthest = np.maximum.accumulate(np.where(np.isnan(arclengths), -np.inf, arclengths))
+            farthest = np.concatenate([[-np.inf], farthest[:-1]])
+            behind = np.flatnonzero(arclengths < farthest)
+            if len(behind) == 0:
+                return arclengths
+
+            arclengths = arclengths.copy()
+            arclengths[behind] = self._project_ahead(longitudes[behind], latitudes[behind], farthest[behind])
+
+    def _project_ahead(self, longitudes, latitudes, start_arclengths):
+        """
+        Projects points onto the part of the line string after a start arclength per point. A point that is closer to the 
+        position at its start arclength than to any segment further along the line string, such as a point only behind 
+        by GPS noise, stays at the start arclength. The segments closer than that position are looked up with a single 
+        STRtree query, so points far from any later part of the line string do not scan its remaining segments. Where 
+        several segments are equally near, the first one along the line string is used.
+
+        Parameters:
+            longitudes (ndarray): The longitudes of the points to project.
+            latitudes (ndarray): The latitudes of the points to project.
+            start_arclengths (ndarray): The planar arclength from which each point is projected.
+
+        Returns:
+            ndarray: The planar arclength of each projected point, at least its start arclength.
+        """
+        start_segments = np.clip(np.searchsorted(self._planar_cum_len, start_arclengths, side='right') - 1, 0, len(self._planar_segment_len) - 1)
+        start_fractions = np.divide(start_arclengths - self._planar_cum_len[start_segments], self._planar_segment_len[start_segments], 
+                                    out=np.zeros_like(start_arclengths), where=self._planar_segment_len[start_segments] > 0)
+        start_coords = self.points[start_segments] + start_fractions[:, np.newaxis] * (self.points[start_segments + 1] - self.points[start_segments])
+        coords = np.column_stack([longitudes, latitudes])
+
+        radii = np.hypot(coords[:, 0] - start_coords[:, 0], coords[:, 1] - start_coords[:, 1])
+        point_indexes, segment_indexes = self._tree.query(shapely.points(coords), predicate='dwithin', distance=radii)
+        is_ahead = segment_indexes > start_segments[point_indexes]
+
+        # Each point is a candidate for the rest of its start segment and for every nearby segment after it
+        point_indexes = np.concatenate([np.arange(len(coords)), point_indexes[is_ahead]])
+        segment_indexes = np.concatenate([start_segments, segment_indexes[is_ahead]])
+        is_start = np.arange(len(point_indexes)) < len(coords)
+        piece_starts = np.where(is_start[:, np.newaxis], start_coords[point_indexes], self.points[segment_indexes])
+        piece_start_arclengths = np.where(is_start, start_arclengths[point_indexes], self._planar_cum_len[segment_indexes])
+
+        piece_vectors = self.points[segment_indexes + 1] - piece_starts
+        squared_lengths = np.einsum('ij,ij->i', piece_vectors, piece_vectors)
+        start_to_point = coords[point_indexes] - piece_starts
+        fractions = np.clip(np.divide(np.einsum('ij,ij->i', start_to_point, piece_vectors), squared_lengths, 
+                                      out=np.zeros_like(squared_lengths), where=squared_lengths > 0), 0.0, 1.0)
+        offsets = start_to_point - fractions[:, np.newaxis] * piece_vectors
+        distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        candidate_arclengths = piece_start_arclengths + fractions * (self._planar_cum_len[segment_indexes + 1] - piece_start_arclengths)
+
+        order = np.lexsort((segment_indexes, distances, point_indexes))
+        nearest = order[np.searchsorted(point_indexes[order], np.arange(len(coords)))]
+
+        return np.maximum(candidate_arclengths[nearest], start_arclengths)
+
+    def _initialize(self, points, distance_method):
+        """
+        Stores the validated points, creates the line string and precomputes the cumulative distances of its points.
+
+        Parameters:
+            points (ndarray): The validated (longitude, latitude) points, one row per point.
+            distance_method (str): 'geodesic' or 'haversine'.
+
+        Raises:
+            ValueError: If the distance_method is not supported.
+        """
+        if distance_method not in ('geodesic', 'haversine'):
+            raise ValueError("distance_method must be either 'geodesic' or 'haversine'")
+
+        self.distance_method = distance_method
+        self.points = points
+        self.line_string = self._create_line_string()
+        self._precompute_distances()
+
+    def _precompute_distances(self):
+        """
+        Computes the length of each segment of the line string and the cumulative distance from the start of the 
+        line string to each point, so projections only need a table lookup per point. The planar lengths of the 
+        segments are stored alongside to locate projected points by their arclength.
+        """
+        self._planar_segment_len = np.hypot(np.diff(self.points[:, 0]), np.diff(self.points[:, 1]))
+        self._planar_cum_len = np.concatenate([[0.0], np.cumsum(self._planar_segment_len)])
+
+        self._geod = Geod(ellps='WGS84')
+        self._segment_km = self._distance_km(self.points[:-1, 0], self.points[:-1, 1], self.points[1:, 0], self.points[1:, 1])
+        self._cum_km = np.concatenate([[0.0], np.cumsum(self._segment_km)])
+
+    def _distance_km(self, lon1, lat1, lon2, lat2):
+        """
+        Calculates the distances in kilometers between pairs of points with the configured distance_method.
+
+        Parameters:
+            lon1, lat1 (ndarray): The coordinates of the start points.
+            lon2, lat2 (ndarray): The coordinates of the end points.
+
+        Returns:
+            ndarray: The distance in kilometers between each pair of points.
+        """
+        if self.distance_method == 'haversine':
+            return self._haversine_km(lon1, lat1, lon2, lat2)
+
+        if np.size(lon1) == 1:
+            # pyproj converts single element arrays to scalars for its fast path, which numpy deprecates
+            _, _, meters = self._geod.inv(*(np.repeat(np.ravel(coordinate), 2) for coordinate in (lon1, lat1, lon2, lat2)))
+            return meters[:1] / 1000.0
+
+        _, _, meters = self._geod.inv(lon1, lat1, lon2, lat2)
+        return meters / 1000.0
+
+    @staticmethod
+    def _haversine_km(lon1, lat1, lon2, lat2):
+        """
+        Calculates the great-circle distances in kilometers between pairs of points on a sphere of the mean Earth radius.
+
+        Parameters:
+            lon1, lat1 (ndarray): The coordinates of the start points.
+            lon2, lat2 (ndarray): The coordinates of the end points.
+
+        Returns:
+            ndarray: The haversine distance in kilometers between each pair of points.
+        """
+        R = 6371.0088
+        dlat = np.radians(lat2 - lat1)
+        dlon = np.radians(lon2 - lon1)
+        a = np.sin(dlat / 2) ** 2 + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlon / 2) ** 2
+        return 2 * R * np.arcsin(np.sqrt(a))
 
     def _create_line_string(self):
         """
-        Creates a LineString object from the provided points.
+        Creates a LineString object from the provided points and an STRtree over its segments. Long line strings look up 
+        the nearest segment of each point in the STRtree, as that is then cheaper than projecting it onto every segment.
 
         Returns:
             LineString: The LineString object created from the points.
         """
+        self._use_tree = len(self.points) >= 96
+        self._tree = shapely.STRtree(shapely.linestrings(np.stack([self.points[:-1], self.points[1:]], axis=1)))
+
         return LineString(self.points)
 
     def _validate_points(self, points):
         """
-        Validates the input list of points to ensure it meets the criteria for constructing a line string.
+        Validates the input points to ensure they meet the criteria for constructing a line string.
 
         Parameters:
-            points (list): The list of point tuples to validate.
+            points (ndarray): The points to validate, before conversion to float64. Strings, booleans and integers are rejected.
 
         Returns:
             bool: True if the points are valid, False otherwise.
         """
-        if not isinstance(points, list):
-            return False
-
-        for point in points:
-            if not (isinstance(point, tuple) and len(point) == 2 and 
-                    all(isinstance(coordinate, float) for coordinate in point)):
-                return False
-
-        return True
+        return points.ndim == 2 and points.shape[1] == 2 and points.dtype.kind == 'f'
     
 class RoutePlan:
     """
@@ -123,7 +451,7 @@ class RoutePlan:
     utilizing a provided line string for spatial reference.
 
     Attributes:
-        points (list of tuples): The list of geotagged points (longitude, latitude, timestamp).
+        points (ndarray or DataFrame): The geotagged points (longitude, latitude, timestamp).
         line_string (LineStringConstructor): An instance of LineStringConstructor for projecting points.
         geotagged_timestamps (DataFrame): A DataFrame holding the processed schedule or trip information.
     """
@@ -133,7 +461,7 @@ class RoutePlan:
         Initializes the RoutePlan with geotagged points and a line string object.
 
         Parameters:
-            points (list of tuples): A list of geotagged points (longitude, latitude, timestamp).
+            points (list of tuples or array-like): A list of geotagged points (longitude, latitude, timestamp).
             The coordinates should be float and the timestamp should be in epoch style and float. 
             line_string_object (LineStringConstructor, optional): An instance of LineStringConstructor.
 
@@ -142,11 +470,69 @@ class RoutePlan:
             TypeError: If the line_string_object is not an instance of LineStringConstructor.
         """
         if points is None:
-            points = []
+            points = np.empty((0, 3))
+
+        try:
+            points = np.asarray(points)
+        except (TypeError, ValueError):
+            raise ValueError('Points must be a list of tuples (longitude, latitude, timestamp) with floats.') from None
+
+        if points.size == 0:
+            points = points.reshape(0, 3)
         
         if not self._validate_geotagged_timestamp(points):
             raise ValueError('Points must be a list of tuples (longitude, latitude, timestamp) with floats.')
 
+        points = points.astype(np.float64, copy=False)
+
+        self._initialize(points, line_string_object)
+
+    @classmethod
+    def from_arrays(cls, longitudes, latitudes, timestamps, line_string_object=None):
+        """
+        Creates a RoutePlan directly from coordinate and timestamp arrays, without building a list of tuples. 
+        The arrays are converted to float64, as in __init__, so epoch timestamps keep their precision.
+
+        Parameters:
+            longitudes (array-like): The longitudes of the geotagged points as floats.
+            latitudes (array-like): The latitudes of the geotagged points as floats.
+            timestamps (array-like): The epoch timestamps of the geotagged points as floats.
+            line_string_object (LineStringConstructor, optional): An instance of LineStringConstructor.
+
+        Returns:
+            RoutePlan: The RoutePlan created from the arrays.
+
+        Raises:
+            ValueError: If the arrays are not one dimensional float arrays of the same length.
+            TypeError: If the line_string_object is not an instance of LineStringConstructor.
+        """
+        longitudes = np.asarray(longitudes)
+        latitudes = np.asarray(latitudes)
+        timestamps = np.asarray(timestamps)
+
+        if not _validate_float_arrays(longitudes, latitudes, timestamps):
+            raise ValueError('Longitudes, latitudes and timestamps must be one dimensional float arrays of the same length.')
+
+        longitudes = longitudes.astype(np.float64, copy=False)
+        latitudes = latitudes.astype(np.float64, copy=False)
+        timestamps = timestamps.astype(np.float64, copy=False)
+
+        route_plan = cls.__new__(cls)
+        route_plan._initialize(pd.DataFrame({'longitude': longitudes, 'latitude': latitudes, 'timestamp': timestamps}), line_string_object)
+
+        return route_plan
+
+    def _initialize(self, points, line_string_object):
+        """
+        Stores the validated points and line string object and creates the geotagged timestamps.
+
+        Parameters:
+            points (ndarray or DataFrame): The validated geotagged points (longitude, latitude, timestamp).
+            line_string_object (LineStringConstructor, optional): An instance of LineStringConstructor.
+
+        Raises:
+            TypeError: If the line_string_object is not an instance of LineStringConstructor.
+        """
         if line_string_object is not None and not isinstance(line_string_object, LineStringConstructor):
             raise TypeError('line_string must be an instance of LineStringConstructor')
         
@@ -169,23 +555,15 @@ class RoutePlan:
     
     def _validate_geotagged_timestamp(self, schedule_points):
         """
-        Validates the input list of geotagged points to ensure it meets the requirements for a schedule.
+        Validates the input geotagged points to ensure they meet the requirements for a schedule.
 
         Parameters:
-            schedule_points (list): The list of geotagged point tuples to validate.
+            schedule_points (ndarray): The geotagged points to validate, before conversion to float64. Strings, booleans and integers are rejected.
 
         Returns:
             bool: True if the points are valid, False otherwise.
         """
-        if not isinstance(schedule_points, list):
-            return False
-
-        for geotagged_timestamp in schedule_points:
-            if not (isinstance(geotagged_timestamp, tuple) and len(geotagged_timestamp) == 3 and 
-                    all(isinstance(data, float) for data in geotagged_timestamp)):
-                return False
-
-        return True
+        return schedule_points.ndim == 2 and schedule_points.shape[1] == 3 and schedule_points.dtype.kind == 'f'
     
 class TimeStampPredictor:
     """
@@ -239,95 +617,118 @@ class TimeStampPredictor:
         predict_df = self.schedule.reset_index(drop=False)
         predict_df = predict_df[~predict_df['distance_traveled'].isna()]
         predict_df.rename(columns = {'timestamp':'schedule_timestamp'},inplace=True)
-        predict_df['inverse_speed'] = predict_df['schedule_timestamp'].diff(1).shift(-1) / predict_df['distance_traveled'].diff(1).shift(-1)
-        predict_df = pd.concat([predict_df,self.trip],axis=0).sort_values(by='distance_traveled',kind='mergesort').reset_index(drop=True)
-        predict_df['inverse_speed'] = predict_df['inverse_speed'].fillna(method='ffill')
-        predict_df['weighted_duration'] = predict_df['distance_traveled'].diff().shift(-1)*predict_df['inverse_speed']
-        predict_df['predicted_timestamp'] = predict_df['timestamp']
-        predict_df['dist_to_closest_ts'] = np.nan
-        predict_df['time_to_closest_ts'] = np.nan
-        trip_intermediate_timestamp_indexes = predict_df[~predict_df['timestamp'].isna()].index
-        trip_begining_tail_indexes = np.arange(0,trip_intermediate_timestamp_indexes.min())
-        trip_ending_tail_indexes = np.arange(trip_intermediate_timestamp_indexes.max()+1,predict_df.shape[0])
+        schedule_ts = predict_df['schedule_timestamp'].to_numpy(dtype=np.float64)
+        schedule_dist = predict_df['distance_traveled'].to_numpy()
+        inverse_speed = np.full(len(schedule_ts), np.nan, dtype=np.float32)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse_speed[:-1] = np.diff(schedule_ts) / np.diff(schedule_dist)
+        predict_df['inverse_speed'] = inverse_speed
+        predict_df = self._merge_by_distance(predict_df, self.trip)
+        dist = predict_df['distance_traveled'].to_numpy(dtype=np.float32)
+        inv_spd, weighted_duration = _fill_weighted_duration(predict_df['inverse_speed'].to_numpy(dtype=np.float32), dist)
+        cumulative_weighted_duration = np.concatenate([[0.0], np.cumsum(np.where(np.isnan(weighted_duration), 0.0, weighted_duration), dtype=np.float64)])
+        cumulative_missing_duration = np.concatenate([[0], np.cumsum(np.isnan(weighted_duration))])
+        ts = predict_df['timestamp'].to_numpy(dtype=np.float64)
+        pred = ts.copy()
+        dct = np.full(len(pred), np.nan)
+        ttct = np.full(len(pred), np.nan)
+        trip_intermediate_timestamp_indexes = np.flatnonzero(~np.isnan(ts))
+        first_trip_ts = trip_intermediate_timestamp_indexes.min()
+        last_trip_ts = trip_intermediate_timestamp_indexes.max()
 
         #Intermediate forward propagation of the timestamps for schedule locations between two reported timestamps, if any.
-        for current_ts,next_ts in enumerate(trip_intermediate_timestamp_indexes):
-            if next_ts == trip_intermediate_timestamp_indexes.max():
-                break
-            interval_last_ts = trip_intermediate_timestamp_indexes[current_ts+1]
-            if interval_last_ts - trip_intermediate_timestamp_indexes[current_ts] == 1:
-                pass
-            else:
-                interval_total_duration = predict_df['timestamp'].iloc[interval_last_ts] - predict_df['timestamp'].iloc[next_ts]
-                interval_weighted_duration = predict_df['weighted_duration'].iloc[next_ts:interval_last_ts].sum()
-                for unknown_timestamp in range(next_ts+1,interval_last_ts):
-                    prev_ts = unknown_timestamp - 1
-                    current_dist = predict_df['distance_traveled'].iloc[unknown_timestamp]
-                    prev_dist = predict_df['distance_traveled'].iloc[prev_ts]
-                    prev_speed = predict_df['inverse_speed'].iloc[prev_ts]
-                    
-                    predict_df.at[unknown_timestamp, 'predicted_timestamp'] = \
-                        predict_df.at[prev_ts, 'predicted_timestamp'] + \
-                        interval_total_duration * prev_speed * (current_dist - prev_dist) / interval_weighted_duration
-                    
-                    forward_dist_to_closest_ts = np.abs(predict_df['predicted_timestamp'].iloc[interval_last_ts] - predict_df['predicted_timestamp'].iloc[unknown_timestamp])
-                    backward_dist_to_closest_ts = np.abs(predict_df['predicted_timestamp'].iloc[next_ts] - predict_df['predicted_timestamp'].iloc[unknown_timestamp])
-
-                    forward_time_to_closest_ts = np.abs(predict_df['timestamp'].iloc[interval_last_ts] - predict_df['predicted_timestamp'].iloc[unknown_timestamp])
-                    backward_time_to_closest_ts = np.abs(predict_df['timestamp'].iloc[next_ts] - predict_df['predicted_timestamp'].iloc[unknown_timestamp])
-
-                    predict_df.at[unknown_timestamp, 'dist_to_closest_ts'] = \
-                        np.where(forward_dist_to_closest_ts <= backward_dist_to_closest_ts, forward_dist_to_closest_ts, backward_dist_to_closest_ts)
-                    
-                    predict_df.at[unknown_timestamp, 'time_to_closest_ts'] = \
-                        np.where(forward_time_to_closest_ts <= backward_time_to_closest_ts, forward_time_to_closest_ts, backward_time_to_closest_ts)
+        for next_ts,interval_last_ts in zip(trip_intermediate_timestamp_indexes[:-1],trip_intermediate_timestamp_indexes[1:]):
+            if interval_last_ts - next_ts == 1:
+                continue
+            interval_total_duration = ts[interval_last_ts] - ts[next_ts]
+            interval_weighted_duration = cumulative_weighted_duration[interval_last_ts] - cumulative_weighted_duration[next_ts]
+            unknown_timestamps = slice(next_ts+1,interval_last_ts)
+            interval_pred = pred[unknown_timestamps]
+            interval_start_ts = pred[next_ts]
+            interval_end_ts = pred[interval_last_ts]
+
+            interval_pred[:] = interval_start_ts + \
+                interval_total_duration * (cumulative_weighted_duration[next_ts+1:interval_last_ts] - cumulative_weighted_duration[next_ts]) / interval_weighted_duration
+            #Points after a segment with an unknown weighted duration cannot be interpolated
+            interval_pred[cumulative_missing_duration[next_ts+1:interval_last_ts] > cumulative_missing_duration[next_ts]] = np.nan
+
+            forward_dist_to_closest_ts = np.abs(interval_end_ts - interval_pred)
+            backward_dist_to_closest_ts = np.abs(interval_start_ts - interval_pred)
+
+            forward_time_to_closest_ts = np.abs(ts[interval_last_ts] - interval_pred)
+            backward_time_to_closest_ts = np.abs(ts[next_ts] - interval_pred)
+
+            dct[unknown_timestamps] = np.where(forward_dist_to_closest_ts <= backward_dist_to_closest_ts, forward_dist_to_closest_ts, backward_dist_to_closest_ts)
+            ttct[unknown_timestamps] = np.where(forward_time_to_closest_ts <= backward_time_to_closest_ts, forward_time_to_closest_ts, backward_time_to_closest_ts)
 
         #Backward propagation of the timestamps for schedule locations between the begining of the trip and the first trip timestamp, if any.
-        if len(trip_begining_tail_indexes) > 0:
-            backward_dist_to_closest_ts = 0
-            backward_time_to_closest_ts = 0
-            for unknown_timestamp in trip_begining_tail_indexes[::-1]:
-                next_ts = unknown_timestamp + 1
-                current_dist = predict_df['distance_traveled'].iloc[unknown_timestamp]
-                next_dist = predict_df['distance_traveled'].iloc[next_ts]
-                current_speed = predict_df['inverse_speed'].iloc[unknown_timestamp]
-                    
-                predict_df.at[unknown_timestamp, 'predicted_timestamp'] = \
-                    predict_df.at[next_ts, 'predicted_timestamp'] - \
-                    current_speed * (next_dist - current_dist) 
-                
-                backward_dist_to_closest_ts += np.abs(next_dist - current_dist)
-                backward_time_to_closest_ts += np.abs(predict_df['predicted_timestamp'].iloc[next_ts] - predict_df['predicted_timestamp'].iloc[unknown_timestamp])
-                
-                predict_df.at[unknown_timestamp, 'dist_to_closest_ts'] = backward_dist_to_closest_ts
-                predict_df.at[unknown_timestamp, 'time_to_closest_ts'] = backward_time_to_closest_ts
-                
+        dct[:first_trip_ts], ttct[:first_trip_ts] = _backfill_tail(pred, dist, inv_spd, first_trip_ts)
+
         #Forward propagation of the timestamps for schedule locations between the end of the trip and the last trip timestamp, if any.
-        if len(trip_ending_tail_indexes) > 0 :
-            forward_dist_to_closest_ts = 0
-            forward_time_to_closest_ts = 0        
-            for unknown_timestamp in trip_ending_tail_indexes:
-                prev_ts = unknown_timestamp - 1
-                current_dist = predict_df['distance_traveled'].iloc[unknown_timestamp]
-                prev_dist = predict_df['distance_traveled'].iloc[prev_ts]
-                prev_speed = predict_df['inverse_speed'].iloc[prev_ts]
-                    
-                predict_df.at[unknown_timestamp, 'predicted_timestamp'] = \
-                    predict_df.at[prev_ts, 'predicted_timestamp'] + \
-                    prev_speed * (current_dist - prev_dist) 
-
-                forward_dist_to_closest_ts += np.abs(current_dist - prev_dist)
-                forward_time_to_closest_ts += np.abs(predict_df['predicted_timestamp'].iloc[unknown_timestamp] - predict_df['predicted_timestamp'].iloc[prev_ts])
-                
-                predict_df.at[unknown_timestamp, 'dist_to_closest_ts'] = forward_dist_to_closest_ts
-                predict_df.at[unknown_timestamp, 'time_to_closest_ts'] = forward_time_to_closest_ts
-
-
-        predict_df['trip_to_schedule_ts_ratio'] = np.round((predict_df['index'].isna().sum() / predict_df['index'].notna().sum()),2)
-
-        predict_df.drop(columns=['schedule_timestamp','weighted_duration','timestamp','inverse_speed'],inplace=True)
-        predict_df.dropna(subset=['index'],inplace=True)
-        predict_df.drop(columns=['index'],inplace=True)
-        predict_df.reset_index(drop=True,inplace=True)
-    
-        return predict_df
+        dct[last_trip_ts+1:], ttct[last_trip_ts+1:] = _forward_tail(pred, dist, inv_spd, last_trip_ts)
+
+        is_schedule = ~np.isnan(predict_df['index'].to_numpy())
+        trip_to_schedule_ts_ratio = np.round(np.sum(~is_schedule) / np.sum(is_schedule),2)
+
+        return pd.DataFrame({
+            'longitude': predict_df['longitude'].to_numpy()[is_schedule],
+            'latitude': predict_df['latitude'].to_numpy()[is_schedule],
+            'distance_traveled': dist[is_schedule],
+            'predicted_timestamp': pred[is_schedule],
+            'dist_to_closest_ts': dct[is_schedule],
+            'time_to_closest_ts': ttct[is_schedule],
+            'trip_to_schedule_ts_ratio': np.full(np.sum(is_schedule), trip_to_schedule_ts_ratio),
+        })
+
+    def _merge_by_distance(self, schedule, trip):
+        """
+        Merges the schedule and trip rows into a single DataFrame ordered by distance traveled.
+        Both inputs are stably sorted by distance and their rows are interleaved with np.searchsorted, which is equivalent 
+        to a stable sort of the concatenated rows: schedule rows come before trip rows at equal distances, and rows 
+        without a distance come last. All columns of each input are stacked into a 2D array and scattered into a single 
+        preallocated output at once.
+
+        Parameters:
+            schedule (DataFrame): The schedule rows with a 'distance_traveled' column.
+            trip (DataFrame): The trip rows with a 'distance_traveled' column.
+
+        Returns:
+            DataFrame: The merged rows with the columns of both inputs as floats of at least their original precision, 
+                       missing values filled with NaN.
+        """
+        schedule_dist = schedule['distance_traveled'].to_numpy()
+        trip_dist = trip['distance_traveled'].to_numpy()
+        schedule_order = np.argsort(schedule_dist, kind='stable')
+        trip_order = np.argsort(trip_dist, kind='stable')
+
+        trip_positions = np.searchsorted(schedule_dist[schedule_order], trip_dist[trip_order], side='right') + np.arange(len(trip_order))
+        is_trip = np.zeros(len(schedule_order) + len(trip_order), dtype=bool)
+        is_trip[trip_positions] = True
+
+        columns = schedule.columns.union(trip.columns, sort=False)
+        merged = np.full((len(is_trip), len(columns)), np.nan)
+        merged[np.ix_(np.flatnonzero(~is_trip), columns.get_indexer(schedule.columns))] = schedule.to_numpy(dtype=np.float64)[schedule_order]
+        merged[np.ix_(trip_positions, columns.get_indexer(trip.columns))] = trip.to_numpy(dtype=np.float64)[trip_order]
+
+        dtypes = {column: np.result_type(np.float32, *(df[column].dtype for df in (schedule, trip) if column in df)) for column in columns}
+        return pd.DataFrame(merged, columns=columns).astype(dtypes)
+
+
+def predict_trip(shape, schedule, trip):
+    """
+    Predicts the schedule timestamps of a single trip, from building the line string to the interpolation.
+    Trips are independent of each other, so this function can be dispatched to separate processes to predict many trips in parallel.
+
+    Parameters:
+        shape (DataFrame): The ordered 'longitude' and 'latitude' float columns of the line string points.
+        schedule (DataFrame): The 'longitude', 'latitude' and 'timestamp' float columns of the schedule.
+        trip (DataFrame): The 'longitude', 'latitude' and 'timestamp' float columns of the trip.
+
+    Returns:
+        DataFrame: The predicted schedule, as returned by TimeStampPredictor.predict_schedule_by_trip.
+    """
+    line_string = LineStringConstructor.from_arrays(shape['longitude'], shape['latitude'])
+    schedule_plan = RoutePlan.from_arrays(schedule['longitude'], schedule['latitude'], schedule['timestamp'], line_string)
+    trip_plan = RoutePlan.from_arrays(trip['longitude'], trip['latitude'], trip['timestamp'], line_string)
+
+    return TimeStampPredictor(schedule_plan, trip_plan).predict_schedule_by_trip()
@@ -0,0 +1,220 @@
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.lstspred import LineStringConstructor, RoutePlan, TimeStampPredictor, predict_trip
+
+
+OUT_AND_BACK = [(0.0, 0.0), (0.01, 0.0), (0.02, 0.0), (0.01, 0.0), (0.0, 0.0)]
+
+
+def test_project_and_calculate_distance_follows_out_and_back_route():
+    line = LineStringConstructor(OUT_AND_BACK)
+    df = pd.DataFrame({'longitude': [0.005, 0.015, 0.018, 0.012, 0.005],
+                       'latitude': [0.0001, 0.0, -0.0001, 0.0, 0.0]})
+
+    distances = line.project_and_calculate_distance(df).to_numpy()
+
+    assert np.all(np.diff(distances) >= 0)
+    np.testing.assert_allclose(distances, [0.557, 1.670, 2.004, 3.117, 3.896], atol=1e-3)
+
+
+def test_project_and_calculate_distance_keeps_repeated_location_in_place():
+    line = LineStringConstructor(OUT_AND_BACK)
+    df = pd.DataFrame({'longitude': [0.005, 0.015, 0.015, 0.005], 'latitude': [0.0] * 4})
+
+    distances = line.project_and_calculate_distance(df).to_numpy()
+
+    np.testing.assert_allclose(distances, [0.557, 1.670, 1.670, 3.896], atol=1e-3)
+
+
+def test_project_and_calculate_distance_keeps_points_after_the_end_of_the_line():
+    line = LineStringConstructor([(0.0357, 0.0084), (0.0198, 0.0455), (0.0281, 0.0289), (0.0097, 0.0263)])
+    df = pd.DataFrame({'longitude': [0.0097, 0.03], 'latitude': [0.0263, 0.02]})
+    distances = line.project_and_calculate_distance(df).to_numpy()
+    assert distances[1] == distances[0]
+
+
+def test_project_and_calculate_distance_stays_fast_on_noisy_points():
+    rng = np.random.default_rng(0)
+    vertices = np.linspace(0.0, 1.0, 2000)
+    line = LineStringConstructor(np.column_stack([vertices * 0.5, 0.05 * np.sin(vertices * 20)]))
+    samples = np.sort(rng.uniform(0.0, 1.0, 20000))
+    coords = np.column_stack([samples * 0.5, 0.05 * np.sin(samples * 20)]) + rng.normal(0, 2e-5, (20000, 2))
+    df = pd.DataFrame({'longitude': coords[:, 0], 'latitude': coords[:, 1]})
+
+    started = time.perf_counter()
+    distances = line.project_and_calculate_distance(df).to_numpy()
+    assert time.perf_counter() - started < 3.0
+    assert np.all(np.diff(distances) >= 0)
+    clean = line.project_and_calculate_distance(df.assign(longitude=samples * 0.5, latitude=0.05 * np.sin(samples * 20))).to_numpy()
+    np.testing.assert_allclose(distances, clean, atol=0.01)
+
+
+def _project_with_both_paths(line, df):
+    line._use_tree = True
+    via_tree = line.project_and_calculate_distance(df).to_numpy()
+    line._use_tree = False
+    via_cumsum = line.project_and_calculate_distance(df).to_numpy()
+    return via_tree, via_cumsum
+
+
+def test_tree_and_cumsum_projections_return_identical_distances():
+    rng = np.random.default_rng(0)
+    corners = np.array([[0.0, 0.0], [0.02, 0.0], [0.02, 0.02], [0.0, 0.02], [0.02, 0.0], [0.0, 0.0]])
+    route = np.vstack([corners, corners[::-1][1:]])
+    points = np.vstack([np.linspace(route[i], route[i + 1], 20, endpoint=False) for i in range(len(route) - 1)] + [route[-1:]])
+    line = LineStringConstructor(points)
+    assert line._use_tree
+
+    for sample in range(20):
+        coords = points[rng.integers(0, len(points), 40)] + rng.normal(0, 1e-4, (40, 2)) * (rng.random((40, 1)) < 0.5)
+        df = pd.DataFrame({'longitude': coords[:, 0], 'latitude': coords[:, 1]})
+        via_tree, via_cumsum = _project_with_both_paths(line, df)
+        np.testing.assert_array_equal(via_tree, via_cumsum)
+
+
+def test_tree_and_cumsum_projections_return_nan_for_missing_coordinates():
+    points = np.column_stack([np.linspace(0.0, 0.02, 100), np.zeros(100)])
+    line = LineStringConstructor(points)
+    df = pd.DataFrame({'longitude': [0.005, np.nan, 0.015], 'latitude': [0.0, 0.0, np.nan]})
+    via_tree, via_cumsum = _project_with_both_paths(line, df)
+    np.testing.assert_array_equal(via_tree, via_cumsum)
+    assert np.isnan(via_tree[1:]).all() and not np.isnan(via_tree[0])
+
+
+@pytest.mark.parametrize('points', [
+    [('0.0', '0.0'), ('0.01', '0.0')],
+    [(True, False), (False, True)],
+    [(0, 0), (1, 0)],
+    [(0.0, 0.0), (0.01,)],
+])
+def test_line_string_constructor_rejects_points_that_are_not_floats(points):
+    with pytest.raises(ValueError):
+        LineStringConstructor(points)
+
+
+@pytest.mark.parametrize('points', [
+    [('0.0', '0.0', '1.0')],
+    [(True, False, True)],
+    [(0, 0, 1)],
+])
+def test_route_plan_rejects_points_that_are_not_floats(points):
+    with pytest.raises(ValueError):
+        RoutePlan(points, LineStringConstructor(OUT_AND_BACK))
+
+
+def test_two_point_line_string_projects_a_single_point_without_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        line = LineStringConstructor([(0.0, 0.0), (0.01, 0.0)])
+        distances = line.project_and_calculate_distance(pd.DataFrame({'longitude': [0.005], 'latitude': [0.0]}))
+    np.testing.assert_allclose(line._cum_km, [0.0, 1.113], atol=1e-3)
+    np.testing.assert_allclose(distances.to_numpy(), [0.557], atol=1e-3)
+
+
+def _plan_from_frame(longitudes, distances, timestamps):
+    plan = RoutePlan.__new__(RoutePlan)
+    plan.geotagged_timestamps = pd.DataFrame({
+        'longitude': longitudes,
+        'latitude': np.zeros(len(distances)),
+        'timestamp': np.asarray(timestamps, dtype=np.float64),
+        'distance_traveled': np.asarray(distances, dtype=np.float32),
+    })
+    return plan
+
+
+def test_predict_schedule_by_trip_fills_tails_and_gaps():
+    schedule = _plan_from_frame([0.0, 0.01, 0.02, 0.03, 0.04, 0.05], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0], [0.0, 100.0, 300.0, 400.0, 600.0, 700.0])
+    # The trip point at 2.0 km shares the distance of a schedule point, which must come first
+    trip = _plan_from_frame([0.015, 0.02, 0.035], [1.5, 2.0, 3.5], [1000.0, 1150.0, 1400.0])
+
+    prediction = TimeStampPredictor(schedule, trip).predict_schedule_by_trip()
+
+    expected = pd.DataFrame({
+        'longitude': [0.0, 0.01, 0.02, 0.03, 0.04, 0.05],
+        'latitude': np.zeros(6),
+        'distance_traveled': np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32),
+        'predicted_timestamp': [800.0, 900.0, 1150.0, 1275.0, 1500.0, 1600.0],
+        'dist_to_closest_ts': [1.5, 0.5, 0.0, 125.0, 0.5, 1.5],
+        'time_to_closest_ts': [200.0, 100.0, 0.0, 125.0, 100.0, 200.0],
+        'trip_to_schedule_ts_ratio': np.full(6, 0.5),
+    })
+    pd.testing.assert_frame_equal(prediction, expected)
+
+
+def test_predict_schedule_by_trip_keeps_unknown_durations_unpredicted():
+    schedule = _plan_from_frame([0.01, 0.02, 0.03], [1.0, 2.0, 3.0], [100.0, 200.0, 400.0])
+    # The first trip point comes before any schedule speed is known, the last one could not be projected
+    trip = _plan_from_frame([0.005, 0.025, 0.5], [0.5, 2.5, np.nan], [1000.0, 1300.0, 2000.0])
+
+    prediction = TimeStampPredictor(schedule, trip).predict_schedule_by_trip()
+
+    expected = pd.DataFrame({
+        'longitude': [0.01, 0.02, 0.03],
+        'latitude': np.zeros(3),
+        'distance_traveled': np.array([1.0, 2.0, 3.0], dtype=np.float32),
+        'predicted_timestamp': [np.nan, np.nan, 2000.0],
+        'dist_to_closest_ts': [np.nan, np.nan, 0.0],
+        'time_to_closest_ts': [np.nan, np.nan, 0.0],
+        'trip_to_schedule_ts_ratio': np.full(3, 1.0),
+    })
+    pd.testing.assert_frame_equal(prediction, expected)
+
+
+def test_merge_by_distance_puts_schedule_rows_first_and_missing_distances_last():
+    schedule = pd.DataFrame({'stop': [1.0, 2.0, 3.0], 'distance_traveled': np.array([2.0, 0.0, 1.0], dtype=np.float32)})
+    trip = pd.DataFrame({'timestamp': [10.0, 20.0, 30.0], 'distance_traveled': np.array([np.nan, 1.0, 0.5], dtype=np.float32)})
+
+    merged = TimeStampPredictor.__new__(TimeStampPredictor)._merge_by_distance(schedule, trip)
+
+    np.testing.assert_array_equal(merged['distance_traveled'], [0.0, 0.5, 1.0, 1.0, 2.0, np.nan])
+    np.testing.assert_array_equal(merged['stop'], [2.0, np.nan, 3.0, np.nan, 1.0, np.nan])
+    np.testing.assert_array_equal(merged['timestamp'], [np.nan, 30.0, np.nan, 20.0, np.nan, 10.0])
+    assert merged['distance_traveled'].dtype == np.float32
+
+
+def test_from_arrays_converts_coordinates_and_timestamps_to_float64():
+    longitudes = np.array([0.0, 0.5, 1.0], dtype=np.float32)
+    latitudes = np.zeros(3, dtype=np.float32)
+    line = LineStringConstructor.from_arrays(longitudes, latitudes)
+    plan = RoutePlan.from_arrays(longitudes, latitudes, np.array([1.7e9, 1.7e9 + 1, 1.7e9 + 2], dtype=np.float32), line)
+
+    assert line.points.dtype == np.float64
+    np.testing.assert_array_equal(line._cum_km, LineStringConstructor([(0.0, 0.0), (0.5, 0.0), (1.0, 0.0)])._cum_km)
+    assert plan.geotagged_timestamps['timestamp'].dtype == np.float64
+
+
+def test_haversine_distances_use_a_sphere():
+    df = pd.DataFrame({'longitude': [0.01], 'latitude': [0.0]})
+    geodesic = LineStringConstructor([(0.0, 0.0), (0.02, 0.0)]).project_and_calculate_distance(df)
+    haversine = LineStringConstructor([(0.0, 0.0), (0.02, 0.0)], distance_method='haversine').project_and_calculate_distance(df)
+
+    np.testing.assert_allclose(geodesic.to_numpy(), [1.113195], rtol=1e-6)
+    np.testing.assert_allclose(haversine.to_numpy(), [1.111951], rtol=1e-6)
+
+
+def test_predict_trip_interpolates_a_constant_speed_schedule():
+    shape = pd.DataFrame({'longitude': [0.0, 0.01, 0.02], 'latitude': [0.0, 0.0, 0.0]})
+    schedule = pd.DataFrame({'longitude': [0.0, 0.01, 0.02], 'latitude': [0.0, 0.0, 0.0], 'timestamp': [0.0, 100.0, 200.0]})
+    trip = pd.DataFrame({'longitude': [0.005, 0.015], 'latitude': [0.0, 0.0], 'timestamp': [1000.0, 1100.0]})
+
+    prediction = predict_trip(shape, schedule, trip)
+
+    np.testing.assert_allclose(prediction['predicted_timestamp'], [950.0, 1050.0, 1150.0], atol=1e-3)
+    np.testing.assert_allclose(prediction['distance_traveled'], [0.0, 1.113195, 2.22639], rtol=1e-6)
+
+
+def test_route_plan_accepts_an_empty_list_of_points():
+    schedule = RoutePlan([], LineStringConstructor(OUT_AND_BACK)).geotagged_timestamps
+
+    assert schedule.empty
+    assert list(schedule.columns) == ['longitude', 'latitude', 'timestamp', 'distance_traveled']
+
+
+def test_line_string_constructor_requires_two_points_for_an_empty_list():
+    with pytest.raises(ValueError, match='Minimum of two points'):
+        LineStringConstructor([])